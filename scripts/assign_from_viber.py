@@ -1,16 +1,33 @@
 #!/usr/bin/env python3
 import argparse
 import html
+import http.client
 import json
 import locale
 import os
 import re
 import sys
+import threading
+import urllib.parse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-import xmlrpc.client
+
+import cache
 
 CODE_RE = re.compile(r"\bTSK-[A-Z0-9]+-\d+\b")
 TAG_RE = re.compile(r"<[^>]+>")
+DOTENV_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(?:"(.*)"[ \t]*$|'(.*)'[ \t]*$|(.*))""",
+    re.M,
+)
+MAX_WORKERS = 8
+# Seconds to wait on a single Odoo request before giving up
+RPC_TIMEOUT = 60
+
+_thread_state = threading.local()
+# res.users records already fetched this run, by id
+user_cache = {}
 
 def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
@@ -35,17 +52,21 @@ def load_dotenv(path):
     if not os.path.exists(path):
         return
     with open(path, "r", encoding="utf-8") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, val = line.split("=", 1)
-            key = key.strip()
-            val = val.strip().strip('"').strip("'")
-            if key and key not in os.environ:
-                os.environ[key] = val
+        data = f.read()
+    for m in DOTENV_RE.finditer(data):
+        key, double_quoted, single_quoted, bare = m.groups()
+        if double_quoted is not None:
+            val = double_quoted
+        elif single_quoted is not None:
+            val = single_quoted
+        else:
+            val = bare.strip().strip('"').strip("'")
+        os.environ.setdefault(key, val)
+
+
+def write_lines(lines):
+    # One write for a whole block instead of a print() per line.
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def prompt_multiline():
@@ -54,24 +75,84 @@ def prompt_multiline():
 
 
 def extract_codes(text):
-    return sorted(set(CODE_RE.findall(text)))
-
-
-def xmlrpc_login(url, db, user, password):
-    common = xmlrpc.client.ServerProxy(f"{url}/xmlrpc/2/common")
-    uid = common.authenticate(db, user, password, {})
+    # Unique codes in the order they were pasted.
+    return list(dict.fromkeys(CODE_RE.findall(text)))
+
+
+class JsonRpcProxy:
+    """Odoo JSON-RPC client holding one persistent HTTP/1.1 connection.
+
+    Exposes execute_kw() with the same arguments as the XML-RPC object proxy.
+    Not thread-safe; use one instance per thread.
+    """
+
+    def __init__(self, url, timeout=RPC_TIMEOUT):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise ValueError(f"Unsupported Odoo URL {url!r}; expected http(s)://host[:port]")
+        conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.conn = conn_cls(parts.netloc, timeout=timeout)
+        self.path = parts.path.rstrip("/") + "/jsonrpc"
+        self.request_id = 0
+
+    def call(self, service, method, *args):
+        self.request_id += 1
+        body = json.dumps({
+            "jsonrpc": "2.0",
+            "method": "call",
+            "id": self.request_id,
+            "params": {"service": service, "method": method, "args": args},
+        })
+        headers = {"Content-Type": "application/json"}
+        # Retry once if the server dropped the idle keep-alive connection.
+        for attempt in (0, 1):
+            try:
+                self.conn.request("POST", self.path, body, headers)
+                resp = self.conn.getresponse()
+                data = resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self.conn.close()
+                if attempt:
+                    raise
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status} {resp.reason} from {self.path}")
+        reply = json.loads(data)
+        error = reply.get("error")
+        if error:
+            detail = error.get("data") or {}
+            raise RuntimeError(detail.get("message") or error.get("message") or "JSON-RPC error")
+        return reply.get("result")
+
+    def execute_kw(self, *args):
+        return self.call("object", "execute_kw", *args)
+
+
+def jsonrpc_login(url, db, user, password):
+    models = JsonRpcProxy(url)
+    uid = models.call("common", "authenticate", db, user, password, {})
     if not uid:
         raise RuntimeError("Authentication failed")
-    models = xmlrpc.client.ServerProxy(f"{url}/xmlrpc/2/object")
     return uid, models
 
 
-def search_read(models, db, uid, password, model, domain, fields, limit=None, order=None):
+def thread_models(url):
+    # A proxy's connection is not thread-safe, so each worker thread gets its own.
+    models = getattr(_thread_state, "models", None)
+    if models is None:
+        models = JsonRpcProxy(url)
+        _thread_state.models = models
+    return models
+
+
+def search_read(models, db, uid, password, model, domain, fields, limit=None, order=None, context=None):
     kwargs = {"fields": fields}
     if limit is not None:
         kwargs["limit"] = limit
     if order is not None:
         kwargs["order"] = order
+    if context is not None:
+        kwargs["context"] = context
     return models.execute_kw(db, uid, password, model, "search_read", [domain], kwargs)
 
 
@@ -79,22 +160,85 @@ def read(models, db, uid, password, model, ids, fields):
     return models.execute_kw(db, uid, password, model, "read", [ids], {"fields": fields})
 
 
+def read_group(models, db, uid, password, model, domain, fields, groupby, lazy=True):
+    return models.execute_kw(db, uid, password, model, "read_group", [domain, fields, groupby], {"lazy": lazy})
+
+
+def read_users(models, db, uid, password, ids, fields):
+    # Only fetch users not already seen this run with the requested fields.
+    missing = [i for i in ids if not all(f in user_cache.get(i, {}) for f in fields)]
+    if missing:
+        for u in read(models, db, uid, password, "res.users", missing, fields):
+            user_cache.setdefault(u["id"], {}).update(u)
+    return [user_cache[i] for i in ids if i in user_cache]
+
+
 def write(models, db, uid, password, model, ids, values):
     return models.execute_kw(db, uid, password, model, "write", [ids, values])
 
 
-def resolve_users(models, db, uid, password, identifiers):
+def search_users(models, db, uid, password, idents):
+    # One query for all identifiers; rows are matched back by login, email, then name.
+    by_login, by_email, by_name = {}, {}, {}
+    if idents:
+        dom = ["|", "|", ("login", "in", idents), ("email", "in", idents), ("name", "in", idents)]
+        users = search_read(models, db, uid, password, "res.users", dom, ["id", "name", "login", "email"])
+        for u in users:
+            for index, field in ((by_login, "login"), (by_email, "email"), (by_name, "name")):
+                if u.get(field):
+                    index.setdefault(u[field], u)
     resolved = {}
-    for ident in identifiers:
-        dom = ["|", "|", ("login", "=", ident), ("email", "=", ident), ("name", "=", ident)]
-        users = search_read(models, db, uid, password, "res.users", dom, ["id", "name", "login", "email"], limit=1)
-        if users:
-            resolved[ident] = users[0]
-        else:
-            resolved[ident] = None
+    for ident in idents:
+        resolved[ident] = by_login.get(ident) or by_email.get(ident) or by_name.get(ident)
     return resolved
 
 
+def resolve_users(models, db, uid, password, identifiers, cache_ns, refresh=False):
+    idents = list(identifiers)
+    key = "users:" + json.dumps(sorted(set(idents)), ensure_ascii=False)
+    resolved = cache.get(cache_ns, key, lambda: search_users(models, db, uid, password, idents), refresh=refresh)
+    for u in resolved.values():
+        if u:
+            user_cache.setdefault(u["id"], u)
+    return {ident: resolved.get(ident) for ident in idents}
+
+
+def search_tasks_by_code(models, db, uid, password, codes, fields):
+    # One search for every pasted code instead of one round trip per code.
+    tasks = search_read(models, db, uid, password, "project.task", [("code", "in", codes)], fields)
+    by_code = {code: [] for code in codes}
+    for t in tasks:
+        by_code.setdefault(t.get("code"), []).append(t)
+    return by_code
+
+
+def open_task_stats(models, db, uid, password, project_ids, stage_ids, cutoff):
+    # Open-task counts and recency per developer, for all projects at once.
+    # Both are aggregated server-side so no task rows cross the wire.
+    stats = {pid: ({}, set()) for pid in project_ids}
+    if not project_ids or not stage_ids:
+        return stats
+    domain = [("project_id", "in", project_ids), ("stage_id", "in", stage_ids), ("user_id", "!=", False)]
+    groupby = ["project_id", "user_id"]
+    groups = read_group(models, db, uid, password, "project.task", domain, groupby, groupby, lazy=False)
+    for g in groups:
+        if not g.get("project_id") or not g.get("user_id"):
+            continue
+        counts, _ = stats.setdefault(g["project_id"][0], ({}, set()))
+        counts[g["user_id"][0]] = g["__count"]
+
+    # write_date is stored as naive UTC
+    cutoff_str = cutoff.strftime("%Y-%m-%d %H:%M:%S")
+    recent_domain = domain + [("write_date", ">=", cutoff_str)]
+    groups = read_group(models, db, uid, password, "project.task", recent_domain, groupby, groupby, lazy=False)
+    for g in groups:
+        if not g.get("project_id") or not g.get("user_id"):
+            continue
+        _, recent = stats.setdefault(g["project_id"][0], ({}, set()))
+        recent.add(g["user_id"][0])
+    return stats
+
+
 def pick_project_key(preferred_map, project_id, project_name):
     if project_name in preferred_map:
         return project_name
@@ -106,16 +250,75 @@ def pick_project_key(preferred_map, project_id, project_name):
     return None
 
 
-def resolve_role(role_map, user_rec):
-    if not role_map:
-        return "-"
-    name = user_rec.get("name")
-    login = user_rec.get("login")
-    email = user_rec.get("email")
-    for key in (name, login, email):
-        if key and key in role_map:
-            return role_map[key]
-    return "-"
+def search_role_users(models, db, uid, password, role_keys):
+    # Every user whose name, login or email is a role_map key. Archived users
+    # are included because they can still hold open tasks.
+    if not role_keys:
+        return []
+    dom = ["|", "|", ("login", "in", role_keys), ("email", "in", role_keys), ("name", "in", role_keys)]
+    return search_read(
+        models, db, uid, password,
+        "res.users", dom, ["id", "name", "login", "email"],
+        context={"active_test": False},
+    )
+
+
+def resolve_role_users(models, db, uid, password, role_keys, cache_ns, refresh=False):
+    keys = sorted(role_keys)
+    key = "role_users:" + json.dumps(keys, ensure_ascii=False)
+    return cache.get(cache_ns, key, lambda: search_role_users(models, db, uid, password, keys), refresh=refresh)
+
+
+def build_role_lookup(role_map, role_users):
+    # Map user id -> role once per run, probing name, then login, then email.
+    role_lookup = {}
+    for u in role_users:
+        for key in (u.get("name"), u.get("login"), u.get("email")):
+            if key and key in role_map:
+                role_lookup[u["id"]] = role_map[key]
+                break
+    return role_lookup
+
+
+def gather_candidates(models, db, uid, password, counts, recent, preferred_users, role_lookup, in_progress_stage_ids):
+    # Candidate list
+    # Two identifiers (e.g. a name and an email) can point at the same user
+    preferred_ids = list(dict.fromkeys(u["id"] for u in preferred_users or []))
+    candidate_ids = preferred_ids if preferred_ids else list(counts.keys())
+    if not candidate_ids:
+        return []
+
+    in_progress_counts = Counter()
+    if in_progress_stage_ids:
+        in_progress_tasks = search_read(
+            models, db, uid, password,
+            "project.task",
+            [("stage_id", "in", in_progress_stage_ids), ("user_id", "in", candidate_ids)],
+            ["user_id"],
+        )
+        for t in in_progress_tasks:
+            uid_pair = t.get("user_id")
+            if not uid_pair:
+                continue
+            in_progress_counts[uid_pair[0]] += 1
+
+    # Build candidate info
+    cand_records = read_users(models, db, uid, password, candidate_ids, ["name"])
+    candidates = []
+    for u in cand_records:
+        uid_val = u["id"]
+        candidates.append({
+            "id": uid_val,
+            "name": u["name"],
+            "role": role_lookup.get(uid_val, "-"),
+            "count": counts.get(uid_val, 0),
+            "in_progress": in_progress_counts[uid_val],
+            "recent": uid_val in recent,
+        })
+
+    # Sort by most tasks in project
+    candidates.sort(key=lambda x: (-x["count"], x["name"]))
+    return candidates
 
 
 def html_to_text(value):
@@ -137,27 +340,38 @@ def html_to_text(value):
     return "\n".join(compact).strip()
 
 
-def resolve_stage_ids(models, db, uid, password, stage_names=None, fallback_domain=None):
-    stage_names = stage_names or []
-    if stage_names:
-        stage_ids = search_read(
-            models, db, uid, password,
-            "project.task.type",
-            [("name", "in", stage_names)],
-            ["id", "name"],
-        )
-        ids = [s["id"] for s in stage_ids]
-        if ids:
-            return ids
-    if fallback_domain:
-        stage_ids = search_read(
+def search_stage_ids(models, db, uid, password, groups):
+    # groups maps a key to (stage_names, fallback_domain). All names are looked
+    # up in one query; a fallback is only queried for groups that matched nothing.
+    all_names = sorted({name for names, _ in groups.values() for name in names or []})
+    by_name = {}
+    if all_names:
+        stages = search_read(
             models, db, uid, password,
             "project.task.type",
-            fallback_domain,
+            [("name", "in", all_names)],
             ["id", "name"],
         )
-        return [s["id"] for s in stage_ids]
-    return []
+        for s in stages:
+            by_name.setdefault(s["name"], []).append(s["id"])
+    resolved = {}
+    for key, (names, fallback_domain) in groups.items():
+        ids = [i for name in names or [] for i in by_name.get(name, [])]
+        if not ids and fallback_domain:
+            stages = search_read(
+                models, db, uid, password,
+                "project.task.type",
+                fallback_domain,
+                ["id"],
+            )
+            ids = [s["id"] for s in stages]
+        resolved[key] = ids
+    return resolved
+
+
+def resolve_stage_ids(models, db, uid, password, groups, cache_ns, refresh=False):
+    key = "stages:" + json.dumps(groups, sort_keys=True, ensure_ascii=False)
+    return cache.get(cache_ns, key, lambda: search_stage_ids(models, db, uid, password, groups), refresh=refresh)
 
 
 def main():
@@ -167,6 +381,8 @@ def main():
     ap.add_argument("--input", help="Path to text file containing Viber messages")
     ap.add_argument("--dotenv", default=".env", help="Path to .env file")
     ap.add_argument("--dry-run", action="store_true")
+    ap.add_argument("--refresh-cache", action="store_true", help="Ignore cached stage/user lookups and reload them")
+    ap.add_argument("--verbose", action="store_true", help="Look up and show the logged-in user's name")
     args = ap.parse_args()
 
     load_dotenv(args.dotenv)
@@ -191,13 +407,16 @@ def main():
         sys.exit(1)
 
     try:
-        uid, models = xmlrpc_login(url, db, user, password)
+        uid, models = jsonrpc_login(url, db, user, password)
     except Exception as e:
         eprint(f"Login failed: {e}")
         sys.exit(1)
-    me = read(models, db, uid, password, "res.users", [uid], ["name", "login"])
-    if me:
-        print(f"Login OK: {me[0].get('name')} ({me[0].get('login')})")
+    if args.verbose:
+        me = read_users(models, db, uid, password, [uid], ["name", "login"])
+        if me:
+            print(f"Login OK: {me[0].get('name')} ({me[0].get('login')})")
+    else:
+        print(f"Login OK: {user}")
     if not locale_is_utf8:
         eprint("Warning: terminal locale is not UTF-8. Myanmar text may look broken. Try: export LANG=en_US.UTF-8")
 
@@ -206,24 +425,81 @@ def main():
     preferred_map = cfg.get("preferred_developers", {})
     role_map = cfg.get("developer_roles", {})
     recent_days = int(cfg.get("recent_days", 7))
+    # Stage and user ids are only valid on the server/db/login they came from
+    cache_ns = f"{url.rstrip('/')}|{db}|{user}"
+
+    def rpc(fn, *fn_args):
+        # Run an RPC helper on the calling worker thread's own connection.
+        return fn(thread_models(url), db, uid, password, *fn_args)
+
+    # Read-only preparation. Task, stage and role lookups don't depend on each
+    # other, so they run concurrently; prompts and writes below stay serial.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        tasks_future = ex.submit(
+            rpc, search_tasks_by_code,
+            codes,
+            ["id", "name", "code", "project_id", "user_id", "priority", "description"],
+        )
+        # Resolve open and in-progress stages once for the whole run
+        stages_future = ex.submit(rpc, resolve_stage_ids, {
+            "open": (open_stage_names, [("fold", "=", False)]),
+            "in_progress": (in_progress_stage_names, [("name", "ilike", "progress")]),
+        }, cache_ns, args.refresh_cache)
+        # Preferred developers for every project, in one batch
+        all_idents = sorted({i for idents in preferred_map.values() for i in idents})
+        users_future = ex.submit(rpc, resolve_users, all_idents, cache_ns, args.refresh_cache)
+        roles_future = ex.submit(rpc, resolve_role_users, role_map.keys(), cache_ns, args.refresh_cache)
+
+        tasks_by_code = tasks_future.result()
+        stage_ids = stages_future.result()
+        stage_id_list = stage_ids["open"]
+        in_progress_stage_ids = stage_ids["in_progress"]
+
+        # Count open tasks per developer for every project the codes touch
+        projects = dict(
+            t["project_id"]
+            for tasks in tasks_by_code.values()
+            for t in tasks
+            if t.get("project_id")
+        )
+        cutoff = datetime.now(timezone.utc) - timedelta(days=recent_days)
+        project_stats = open_task_stats(models, db, uid, password, sorted(projects), stage_id_list, cutoff)
+        resolved_users = users_future.result()
+        role_lookup = build_role_lookup(role_map, roles_future.result())
+        preferred_by_key = {
+            key: [resolved_users[i] for i in dict.fromkeys(idents) if resolved_users.get(i)]
+            for key, idents in preferred_map.items()
+        }
+
+        # Gather candidates for every project concurrently
+        def gather(project):
+            project_id, project_name = project
+            pref_key = pick_project_key(preferred_map, project_id, project_name)
+            counts, recent = project_stats.get(project_id, ({}, set()))
+            candidates = rpc(
+                gather_candidates,
+                counts, recent, preferred_by_key.get(pref_key), role_lookup, in_progress_stage_ids,
+            )
+            missing = [i for i in dict.fromkeys(preferred_map.get(pref_key, [])) if not resolved_users.get(i)]
+            return {"missing": missing, "candidates": candidates}
+
+        prepared_by_project = {}
+        if stage_id_list and projects:
+            prepared_by_project = dict(zip(projects, ex.map(gather, projects.items())))
 
     for code in codes:
         print(f"\n=== {code} ===")
-        tasks = search_read(
-            models, db, uid, password,
-            "project.task",
-            [("code", "=", code)],
-            ["id", "name", "code", "project_id", "user_id", "priority", "stage_id", "write_date", "description"],
-        )
+        tasks = tasks_by_code.get(code, [])
         if not tasks:
             print("No task found")
             continue
         if len(tasks) > 1:
-            print("Multiple tasks found:")
+            out = ["Multiple tasks found:"]
             for i, t in enumerate(tasks, 1):
                 pname = t["project_id"][1] if t.get("project_id") else "-"
                 uname = t["user_id"][1] if t.get("user_id") else "-"
-                print(f"{i}. {t['id']} | {t['name']} | Project: {pname} | Assigned: {uname}")
+                out.append(f"{i}. {t['id']} | {t['name']} | Project: {pname} | Assigned: {uname}")
+            write_lines(out)
             sel = input("Select task number: ").strip()
             try:
                 task = tasks[int(sel) - 1]
@@ -243,110 +519,34 @@ def main():
         priority = task.get("priority", "0")
         details = html_to_text(task.get("description")) or "(No description on task)"
 
-        print(f"Task: {task['name']}")
-        print(f"Project: {project_name} | Priority: {priority} | Current: {current_user_name}")
-        print("Ticket description:")
-        print(details)
-
-        # Resolve open stages
-        stage_id_list = resolve_stage_ids(
-            models, db, uid, password,
-            stage_names=open_stage_names,
-            fallback_domain=[("fold", "=", False)],
-        )
+        out = [
+            f"Task: {task['name']}",
+            f"Project: {project_name} | Priority: {priority} | Current: {current_user_name}",
+            "Ticket description:",
+            details,
+        ]
         if not stage_id_list:
-            print("No open stages found; skipping")
+            out.append("No open stages found; skipping")
+            write_lines(out)
             continue
-
-        # Count open tasks per developer in project
-        domain = [("project_id", "=", project_id), ("stage_id", "in", stage_id_list), ("user_id", "!=", False)]
-        open_tasks = search_read(
-            models, db, uid, password,
-            "project.task",
-            domain,
-            ["id", "user_id", "write_date"],
-        )
-        counts = {}
-        recent = {}
-        cutoff = datetime.now(timezone.utc) - timedelta(days=recent_days)
-        for t in open_tasks:
-            uid_pair = t.get("user_id")
-            if not uid_pair:
-                continue
-            uid_val, uname = uid_pair
-            counts[uid_val] = counts.get(uid_val, 0) + 1
-            wdate = t.get("write_date")
-            if wdate:
-                try:
-                    dt = datetime.strptime(wdate, "%Y-%m-%d %H:%M:%S")
-                    if dt >= cutoff:
-                        recent[uid_val] = True
-                except Exception:
-                    pass
-
-        # Preferred developers
-        pref_key = pick_project_key(preferred_map, project_id, project_name)
-        preferred_ids = None
-        if pref_key:
-            resolved = resolve_users(models, db, uid, password, preferred_map[pref_key])
-            preferred_ids = [u["id"] for u in resolved.values() if u]
-            missing = [k for k, v in resolved.items() if v is None]
-            if missing:
-                print("Preferred devs not found:", ", ".join(missing))
-
-        # Candidate list
-        candidate_ids = preferred_ids if preferred_ids else list(counts.keys())
-        if not candidate_ids:
-            print("No candidates found")
+        prepared = prepared_by_project[project_id]
+        if prepared["missing"]:
+            out.append("Preferred devs not found: " + ", ".join(prepared["missing"]))
+        candidates = prepared["candidates"]
+        if not candidates:
+            out.append("No candidates found")
+            write_lines(out)
             continue
 
-        in_progress_stage_ids = resolve_stage_ids(
-            models, db, uid, password,
-            stage_names=in_progress_stage_names,
-            fallback_domain=[("name", "ilike", "progress")],
-        )
-        in_progress_counts = {}
-        if in_progress_stage_ids:
-            in_progress_tasks = search_read(
-                models, db, uid, password,
-                "project.task",
-                [("stage_id", "in", in_progress_stage_ids), ("user_id", "in", candidate_ids)],
-                ["id", "user_id"],
-            )
-            for t in in_progress_tasks:
-                uid_pair = t.get("user_id")
-                if not uid_pair:
-                    continue
-                uid_val = uid_pair[0]
-                in_progress_counts[uid_val] = in_progress_counts.get(uid_val, 0) + 1
-
-        # Build candidate info
-        cand_records = read(models, db, uid, password, "res.users", candidate_ids, ["id", "name", "login", "email"]) 
-        candidates = []
-        for u in cand_records:
-            uid_val = u["id"]
-            candidates.append({
-                "id": uid_val,
-                "name": u["name"],
-                "login": u.get("login"),
-                "email": u.get("email"),
-                "role": resolve_role(role_map, u),
-                "count": counts.get(uid_val, 0),
-                "in_progress": in_progress_counts.get(uid_val, 0),
-                "recent": recent.get(uid_val, False),
-            })
-
-        # Sort by most tasks in project
-        candidates.sort(key=lambda x: (-x["count"], x["name"]))
-
-        print("Candidates (most project tasks first):")
+        out.append("Candidates (most project tasks first):")
         for i, c in enumerate(candidates, 1):
             rec = " recent" if c["recent"] else ""
-            print(f"{i}. {c['name']} | {c['role']} | open tasks in project: {c['count']} | in-progress: {c['in_progress']}{rec}")
+            out.append(f"{i}. {c['name']} | {c['role']} | open tasks in project: {c['count']} | in-progress: {c['in_progress']}{rec}")
 
         top = candidates[0]
         if top["in_progress"] > 0:
-            print(f"Warning: {top['name']} already has {top['in_progress']} in-progress task(s).")
+            out.append(f"Warning: {top['name']} already has {top['in_progress']} in-progress task(s).")
+        write_lines(out)
         yn = input(f"Assign to {top['name']}? [y/N] ").strip().lower()
         if yn != "y":
             sel = input("Enter candidate number to assign (or blank to skip): ").strip()
@@ -0,0 +1,63 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+# Seconds an entry stays fresh
+DEFAULT_TTL = 24 * 60 * 60
+
+_write_lock = threading.Lock()
+
+
+def cache_dir():
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "workflow-automation")
+
+
+def cache_path(namespace):
+    # Readable prefix plus a digest, so namespaces that sanitize alike don't collide.
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", namespace)[:64]
+    digest = hashlib.sha256(namespace.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir(), f"{safe}-{digest}.json")
+
+
+def load_entries(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get(namespace, key, loader, ttl=DEFAULT_TTL, refresh=False):
+    """Return the cached value for key, calling loader() on a miss or expiry.
+
+    Values must be JSON-serializable. Entries live in one JSON file per
+    namespace, which should identify the server, database and login the
+    values came from. refresh=True skips the stored entry and reloads it.
+    Failing to write the cache is not an error; the loaded value is still
+    returned.
+    """
+    path = cache_path(namespace)
+    if not refresh:
+        entry = load_entries(path).get(key)
+        if entry and time.time() - entry.get("ts", 0) < ttl:
+            return entry["value"]
+
+    value = loader()
+    with _write_lock:
+        entries = load_entries(path)
+        entries[key] = {"ts": time.time(), "value": value}
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            # Entries hold user logins and emails; keep them private to the owner.
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return value